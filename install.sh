@@ -68,7 +68,9 @@ fi
 # --- Install Python dependencies ---
 info "Installing Python dependencies..."
 "${INSTALL_DIR}/venv/bin/pip" install --upgrade pip -q
-"${INSTALL_DIR}/venv/bin/pip" install "Pillow==9.5.0" requests -q
+"${INSTALL_DIR}/venv/bin/pip" install "Pillow==9.5.0" numpy requests -q
+# orjson is optional - the server falls back to the stdlib json without it
+"${INSTALL_DIR}/venv/bin/pip" install orjson -q || warn "orjson unavailable, using the stdlib json."
 
 # Install rgbmatrix - try the real library first, fall back to emulator
 if "${INSTALL_DIR}/venv/bin/python3" -c "import rgbmatrix" 2>/dev/null; then
@@ -93,6 +95,29 @@ else
     fi
 fi
 
+# Optional: Pillow-SIMD, a drop-in Pillow fork with SSE4/AVX2 resize and convert
+# kernels. It has no ARM (NEON) code paths, so a Raspberry Pi keeps stock Pillow.
+# Opt in on x86 hosts (e.g. emulator dev boxes): sudo PILLOW_SIMD=1 bash install.sh
+# Runs after the rgbmatrix step: RGBMatrixEmulator depends on "pillow" by name,
+# which pillow-simd doesn't satisfy, so installing it later would put stock
+# Pillow back over PIL.
+if [ "${PILLOW_SIMD:-0}" = "1" ]; then
+    case "$(uname -m)" in
+        x86_64|i686)
+            info "Installing Pillow-SIMD in place of Pillow..."
+            apt-get install -y -qq libjpeg-dev zlib1g-dev 2>/dev/null || true
+            "${INSTALL_DIR}/venv/bin/pip" uninstall -y Pillow -q
+            if ! CC="cc -mavx2" "${INSTALL_DIR}/venv/bin/pip" install "pillow-simd>=9.1" -q; then
+                warn "Pillow-SIMD build failed, restoring stock Pillow."
+                "${INSTALL_DIR}/venv/bin/pip" install "Pillow==9.5.0" -q
+            fi
+            ;;
+        *)
+            warn "Pillow-SIMD is x86-only; keeping stock Pillow on $(uname -m)."
+            ;;
+    esac
+fi
+
 # --- Install systemd service ---
 info "Installing systemd service..."
 cp "${SCRIPT_DIR}/${SERVICE_FILE}" "/etc/systemd/system/${SERVICE_FILE}"
@@ -1,17 +1,56 @@
 #!/usr/bin/env python3
 import json
+import queue
 import threading
 import time
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 import urllib.request
+import warnings
 import io
 import cgi
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
 from PIL import Image, ImageOps, ImageSequence, ImageDraw, ImageFont
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Text scroll falls back to pasting into a reused PIL frame
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # No prebuilt wheel on some Pi models - use the stdlib json
+
 from rgbmatrix import RGBMatrix, RGBMatrixOptions
 from weather_service import weather_service, get_condition_from_code
 from weather_icons import create_weather_display, create_weather_icon
 
+# Largest image download or upload body accepted (bytes)
+MAX_IMAGE_BYTES = 25 * 1024 * 1024
+
+# Longest a whole image download may take (seconds) - urlopen's timeout only
+# bounds each socket read, so a server trickling bytes could otherwise hold
+# the display worker for the full MAX_IMAGE_BYTES
+IMAGE_DOWNLOAD_TIMEOUT = 30
+
+# Longest text accepted by /matrix/show/text, and the widest scroll strip
+# rendered from it (pixels) - keeps the strip and its copies to a few MB
+MAX_TEXT_CHARS = 1000
+MAX_SCROLL_TEXT_WIDTH = 16384
+
+# Memory held by one fitted frame - PIL stores RGB as 4 bytes per pixel
+FRAME_BYTES = 64 * 64 * 4
+
+# Budget for an animation's fitted 64x64 RGB frames (bytes)
+MAX_GIF_FRAME_BYTES = 32 * 1024 * 1024
+
+# Refuse to decode images over 64 megapixels - a hard error rather than PIL's
+# default warning, so decompression bombs can't exhaust the Pi's memory
+Image.MAX_IMAGE_PIXELS = 64_000_000
+warnings.simplefilter("error", Image.DecompressionBombWarning)
+
 
 def detect_pi_model():
     """Detect Raspberry Pi model from /proc/device-tree/model"""
@@ -73,7 +112,43 @@ def detect_gpio_slowdown():
     return slowdown
 
 
+@lru_cache(maxsize=None)
+def load_font(path, size):
+    """Load a TrueType font once per (path, size), falling back to PIL's default"""
+    try:
+        return ImageFont.truetype(path, size)
+    except:
+        return ImageFont.load_default()
+
+
+def render_scroll_strip(text, bg_color, text_color):
+    """
+    Render scrolling text once into a strip 64px wider than one scroll period.
+    
+    The trailing blank columns match the leading ones, so every position
+    (including the wrap-around) is a plain 64-wide window. Text wider than
+    MAX_SCROLL_TEXT_WIDTH is clipped so the strip stays bounded.
+    
+    Returns:
+        (strip, period)
+    """
+    font = load_font("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 12)
+    period = min(int(font.getlength(text)), MAX_SCROLL_TEXT_WIDTH) + 128
+    strip = Image.new("RGB", (period + 64, 64), bg_color)
+    ImageDraw.Draw(strip).text((64, 24), text, fill=text_color, font=font)
+    return strip, period
+
+
 class MatrixHandler:
+    IMAGE_CACHE_SIZE = 32  # URLs kept as pre-fitted frames
+    IMAGE_CACHE_BYTES = 24 * 1024 * 1024  # Memory budget for all cached frames
+    IMAGE_CACHE_TTL = 300  # Seconds before a cached URL is fetched again
+    SCROLL_CACHE_BYTES = 8 * 1024 * 1024  # Memory budget for rendered scroll strips
+    WEATHER_CACHE_SIZE = 64  # Rendered weather displays kept for repeat requests
+    # PWM bit depth per job type. Each bit doubles the refresh thread's BCM
+    # time slots; text and weather blocks look the same at 7 bits, photos need 11
+    PWM_BITS = {"image": 11, "text": 7, "weather": 7}
+
     def __init__(self):
         opts = RGBMatrixOptions()
         opts.rows = 64
@@ -85,20 +160,83 @@ class MatrixHandler:
         opts.hardware_mapping = "regular"
         opts.gpio_slowdown = detect_gpio_slowdown()
         self.matrix = RGBMatrix(options=opts)
+        # Off-screen canvas: frames are drawn here and swapped in on vsync
+        self._canvas = self.matrix.CreateFrameCanvas()
         self.rotation = 90  # 0, 90, 180, or 270 degrees clockwise
         self.stop_event = threading.Event()
         self.current_job = None
         self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._generation = 0  # Bumped by every enqueue/stop; guarded by _lock
+        # blake2b(url) -> (stored_at, frames, delays, nbytes); only the worker touches it
+        self._image_cache = OrderedDict()
+        self._image_cache_bytes = 0
+        self._scroll_cache = OrderedDict()  # (text, bg_color, text_color) -> (strip, period)
+        self._scroll_cache_bytes = 0
+        # (condition, icon, temp, unit, city) -> rotated frame; only the worker touches it
+        self._weather_cache = OrderedDict()
+        threading.Thread(target=self._worker, daemon=True).start()
     
-    def _stop_current_job(self):
-        """Stop any currently running job and wait for it to finish"""
-        self.stop_event.set()
-        # Wait for the thread to notice the stop event and clean up
-        # Give it a bit more time for proper cleanup
-        for _ in range(10):  # Max 0.5 seconds
-            if self.current_job is None:
-                break
-            time.sleep(0.05)
+    def _enqueue(self, job_type, target, *args):
+        """Queue a job for the display worker, superseding whatever is running"""
+        with self._lock:
+            self._generation += 1
+            # Only the newest generation can run, so drop queued jobs now rather
+            # than keep their arguments (e.g. upload bytes) alive until skipped
+            self._drain_queue()
+            self._queue.put((self._generation, job_type, target, args))
+            self.stop_event.set()
+    
+    def _drain_queue(self):
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                return
+    
+    def _worker(self):
+        """Single display thread: the only code that touches self.matrix"""
+        while True:
+            generation, job_type, target, args = self._queue.get()
+            with self._lock:
+                if generation != self._generation:
+                    continue  # Superseded by a newer job or a stop - skip it
+                self.stop_event.clear()
+                self.current_job = job_type
+            try:
+                if job_type in self.PWM_BITS:
+                    self._set_pwm_bits(self.PWM_BITS[job_type])
+                target(*args)
+            except Exception as e:
+                print(f"[ERROR] {job_type} job failed: {e}")
+                import traceback
+                traceback.print_exc()
+            finally:
+                self.current_job = None
+    
+    def _set_pwm_bits(self, bits):
+        """Change PWM depth live on both the displayed and the off-screen buffer"""
+        # RGBMatrixEmulator has no PWM control - skip anything without pwmBits
+        for target in (self._canvas, self.matrix):
+            current = getattr(target, "pwmBits", None)
+            if current is not None and current != bits:
+                target.pwmBits = bits
+    
+    def _hold(self, duration):
+        """Keep the current frame up for duration seconds (0 = forever) or until stopped"""
+        # Blocks on the event instead of polling, so a stop wakes us immediately
+        self.stop_event.wait(timeout=duration if duration > 0 else None)
+    
+    def _push(self, img):
+        """
+        Draw an RGB frame on the off-screen canvas and swap it in on vsync.
+        img is a PIL image, or a (64, 64, 3) uint8 array from text scroll -
+        SetImage needs a PIL image, so Image.fromarray copies arrays into one.
+        """
+        if np is not None and isinstance(img, np.ndarray):
+            img = Image.fromarray(img)
+        self._canvas.SetImage(img)
+        self._canvas = self.matrix.SwapOnVSync(self._canvas)
     
     def _rotate_image(self, img):
         """Rotate image according to self.rotation setting"""
@@ -109,7 +247,118 @@ class MatrixHandler:
         elif self.rotation == 270:
             return img.transpose(Image.Transpose.ROTATE_90)
         return img
-        
+
+    def _fit_frame(self, frame):
+        """Fit a frame to the 64x64 panel and rotate it, ready for _push"""
+        # ImageOps.fit crops to a square first, so the scale factor comes from the
+        # shorter side. BOX (area average) for large downscales - each source pixel
+        # lands in exactly one output pixel, far cheaper than LANCZOS and visually
+        # the same at 64x64. LANCZOS for mild downscales, NEAREST keeps pixel-art
+        # crisp when upscaling
+        if min(frame.size) > 2 * 64:
+            method = Image.Resampling.BOX
+        elif min(frame.size) >= 64:
+            method = Image.Resampling.LANCZOS
+        else:
+            method = Image.Resampling.NEAREST
+        fitted = ImageOps.fit(frame.convert("RGB"), (64, 64), method=method)
+        return self._rotate_image(fitted)
+
+    def _load_frames(self, img):
+        """
+        Convert, fit and rotate every frame once at ingest time.
+
+        Returns:
+            (frames, delays) - delays is None for still images
+        """
+        print(f"[DEBUG] Image format: {img.format}, size: {img.size}, mode: {img.mode}")
+        if not getattr(img, "is_animated", False):
+            # Let libjpeg decode at 1/2, 1/4 or 1/8 scale (no-op for non-JPEG)
+            try:
+                img.draft("RGB", (64, 64))
+            except Exception:
+                pass
+            return [self._fit_frame(img)], None
+        # Reject before decoding anything if the fitted frames would blow the budget
+        n_frames = getattr(img, "n_frames", 1)
+        if n_frames * FRAME_BYTES > MAX_GIF_FRAME_BYTES:
+            raise ValueError(f"Animation has too many frames ({n_frames}) for the memory budget")
+        frames = []
+        delays = []
+        for frame in ImageSequence.Iterator(img):
+            frames.append(self._fit_frame(frame))
+            delays.append(max(0.01, frame.info.get("duration", 70) / 1000.0))
+        return frames, delays
+
+    def _play_frames(self, frames, delays, duration, loops):
+        """
+        Push pre-fitted frames to the matrix until stopped.
+
+        Args:
+            frames: Panel-ready RGB frames from _load_frames
+            delays: Per-frame delays in seconds, or None for a still image
+            duration: Seconds to display. 0 = forever until stopped
+            loops: For GIFs, number of loops. 0 = infinite (respects duration if set)
+        """
+        if delays is None:
+            # Static image - display forever or until duration
+            print(f"[DEBUG] Displaying static image (duration={duration})")
+            self._push(frames[0])
+            self._hold(duration)
+            return
+
+        print(f"[DEBUG] Playing animated GIF with {len(frames)} frames (duration={duration}, loops={loops})")
+        start_time = time.time()
+        frame_idx = 0
+        loop_count = 0
+        while not self.stop_event.is_set():
+            # Check duration limit
+            if duration > 0 and (time.time() - start_time >= duration):
+                break
+            # Check loop limit
+            if loops > 0 and loop_count >= loops:
+                break
+
+            self._push(frames[frame_idx])
+            if self.stop_event.wait(delays[frame_idx]):
+                break
+            frame_idx = (frame_idx + 1) % len(frames)
+            if frame_idx == 0:
+                loop_count += 1
+
+    def _image_cache_get(self, url):
+        """
+        Return cached (frames, delays) for url, or None if missing or stale.
+        Only the display worker calls it, so no lock.
+        """
+        key = hashlib.blake2b(url.encode()).digest()
+        entry = self._image_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, frames, delays, nbytes = entry
+        if time.time() - stored_at > self.IMAGE_CACHE_TTL:
+            del self._image_cache[key]
+            self._image_cache_bytes -= nbytes
+            return None
+        self._image_cache.move_to_end(key)
+        return frames, delays
+
+    def _image_cache_put(self, url, frames, delays):
+        """Store pre-fitted frames for url, evicting least recently used entries"""
+        nbytes = len(frames) * FRAME_BYTES
+        if nbytes > self.IMAGE_CACHE_BYTES // 4:
+            return  # One long animation shouldn't flush everything else
+        key = hashlib.blake2b(url.encode()).digest()
+        old = self._image_cache.pop(key, None)
+        if old is not None:
+            self._image_cache_bytes -= old[3]
+        self._image_cache[key] = (time.time(), frames, delays, nbytes)
+        self._image_cache_bytes += nbytes
+        while (len(self._image_cache) > self.IMAGE_CACHE_SIZE
+               or self._image_cache_bytes > self.IMAGE_CACHE_BYTES):
+            _, evicted = self._image_cache.popitem(last=False)
+            self._image_cache_bytes -= evicted[3]
+
     def show_image_from_url(self, url, duration=0, loops=0):
         """
         Display image from URL.
@@ -119,14 +368,17 @@ class MatrixHandler:
             duration: Seconds to display. 0 = forever until stopped
             loops: For GIFs, number of loops. 0 = infinite (respects duration if set)
         """
-        def worker():
-            import tempfile
-            import os
-            import gc
-            temp_file = None
-            frames = None
-            img = None
-            try:
+        self._enqueue("image", self._do_image_from_url, url, duration, loops)
+
+    def _do_image_from_url(self, url, duration, loops):
+        import gc
+        img = None
+        try:
+            cached = self._image_cache_get(url)
+            if cached:
+                print(f"[DEBUG] Image cache hit: {url}")
+                frames, delays = cached
+            else:
                 print(f"[DEBUG] Fetching image from: {url}")
                 
                 # Create request with proper headers
@@ -137,88 +389,53 @@ class MatrixHandler:
                     if response.status != 200:
                         print(f"[ERROR] HTTP {response.status} when fetching image")
                         return
-                    img_data = response.read()
+                    # Read in chunks so an oversized body is rejected before it fills RAM.
+                    # read1 returns whatever has arrived, so a slow server can't stall
+                    # a stop, a newer job or the deadline for a whole 64 KiB chunk.
+                    buf = io.BytesIO()
+                    deadline = time.monotonic() + IMAGE_DOWNLOAD_TIMEOUT
+                    while True:
+                        chunk = response.read1(64 * 1024)
+                        if not chunk:
+                            break
+                        buf.write(chunk)
+                        if self.stop_event.is_set():
+                            print("[DEBUG] Image download cancelled")
+                            return
+                        if buf.tell() > MAX_IMAGE_BYTES:
+                            print(f"[ERROR] Image exceeds {MAX_IMAGE_BYTES} bytes, aborting download")
+                            return
+                        if time.monotonic() > deadline:
+                            print(f"[ERROR] Image download took over {IMAGE_DOWNLOAD_TIMEOUT}s, aborting")
+                            return
+                    img_data = buf.getvalue()
                     print(f"[DEBUG] Downloaded {len(img_data)} bytes")
                 
-                # Save to temporary file WITHOUT forcing extension - let PIL detect format
-                with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-                    tmp_file.write(img_data)
-                    temp_file = tmp_file.name
-                
-                img = Image.open(temp_file)
-                print(f"[DEBUG] Image format: {img.format}, size: {img.size}, mode: {img.mode}")
+                # Decode straight from memory - PIL detects the format from the header,
+                # no blocking round-trip through a temp file on the SD card
+                img = Image.open(io.BytesIO(img_data))
                 
-                # Handle animated GIFs
-                if getattr(img, "is_animated", False):
-                    frames = []
-                    delays = []
-                    for frame in ImageSequence.Iterator(img):
-                        # Pre-resize and rotate to save memory - store only 64x64 frames
-                        resized = ImageOps.fit(frame.convert("RGB"), (64, 64), method=Image.Resampling.LANCZOS)
-                        rotated = self._rotate_image(resized)
-                        frames.append(rotated.convert('RGB'))
-                        delays.append(max(0.01, frame.info.get("duration", 70) / 1000.0))
-                    
-                    # Close original image to free memory
-                    img.close()
-                    img = None
+                frames, delays = self._load_frames(img)
+                # Close original image to free memory - only 64x64 frames are kept
+                img.close()
+                img = None
+                if self.stop_event.is_set():
+                    return  # Stopped or superseded while decoding
+                self._image_cache_put(url, frames, delays)
+            self._play_frames(frames, delays, duration, loops)
                     
-                    print(f"[DEBUG] Playing animated GIF with {len(frames)} frames (duration={duration}, loops={loops})")
-                    start_time = time.time()
-                    frame_idx = 0
-                    loop_count = 0
-                    while not self.stop_event.is_set():
-                        # Check duration limit
-                        if duration > 0 and (time.time() - start_time >= duration):
-                            break
-                        # Check loop limit
-                        if loops > 0 and loop_count >= loops:
-                            break
-                            
-                        self.matrix.SetImage(frames[frame_idx])
-                        time.sleep(delays[frame_idx])
-                        frame_idx = (frame_idx + 1) % len(frames)
-                        if frame_idx == 0:
-                            loop_count += 1
-                else:
-                    # Static image - display forever or until duration
-                    print(f"[DEBUG] Displaying static image (duration={duration})")
-                    resized = ImageOps.fit(img.convert("RGB"), (64, 64), method=Image.Resampling.LANCZOS)
-                    rotated = self._rotate_image(resized)
+        except Exception as e:
+            print(f"[ERROR] Image display failed: {e}")
+            import traceback
+            traceback.print_exc()
+        finally:
+            # Clean up memory - frames stay alive in the cache
+            if img:
+                try:
                     img.close()
-                    img = None
-                    self.matrix.SetImage(rotated.convert('RGB'))
-                    start_time = time.time()
-                    while not self.stop_event.is_set():
-                        if duration > 0 and (time.time() - start_time >= duration):
-                            break
-                        time.sleep(0.1)
-                        
-            except Exception as e:
-                print(f"[ERROR] Image display failed: {e}")
-                import traceback
-                traceback.print_exc()
-            finally:
-                # Clean up memory
-                if frames:
-                    frames.clear()
-                if img:
-                    try:
-                        img.close()
-                    except:
-                        pass
-                # Clean up temporary file
-                if temp_file and os.path.exists(temp_file):
-                    os.unlink(temp_file)
-                self.current_job = None
-                gc.collect()  # Force garbage collection
-                
-        # Stop any current job first
-        self._stop_current_job()
-        self.stop_event.clear()
-        self.current_job = "image"
-        t = threading.Thread(target=worker, daemon=True)
-        t.start()
+                except:
+                    pass
+            gc.collect()  # Force garbage collection
         
     def show_image_from_data(self, img_data, duration=0, loops=0):
         """
@@ -229,83 +446,33 @@ class MatrixHandler:
             duration: Seconds to display. 0 = forever until stopped
             loops: For GIFs, number of loops. 0 = infinite (respects duration if set)
         """
-        def worker():
-            import gc
-            frames = None
+        self._enqueue("image", self._do_image_from_data, img_data, duration, loops)
+
+    def _do_image_from_data(self, img_data, duration, loops):
+        import gc
+        img = None
+        try:
+            print(f"[DEBUG] Processing uploaded image ({len(img_data)} bytes)")
+            img = Image.open(io.BytesIO(img_data))
+            
+            frames, delays = self._load_frames(img)
+            # Close original image to free memory - only 64x64 frames are kept
+            img.close()
             img = None
-            try:
-                print(f"[DEBUG] Processing uploaded image ({len(img_data)} bytes)")
-                img = Image.open(io.BytesIO(img_data))
-                print(f"[DEBUG] Image format: {img.format}, size: {img.size}, mode: {img.mode}")
-                
-                # Handle animated GIFs
-                if getattr(img, "is_animated", False):
-                    frames = []
-                    delays = []
-                    for frame in ImageSequence.Iterator(img):
-                        # Pre-resize and rotate to save memory - store only 64x64 frames
-                        resized = ImageOps.fit(frame.convert("RGB"), (64, 64), method=Image.Resampling.LANCZOS)
-                        rotated = self._rotate_image(resized)
-                        frames.append(rotated.convert('RGB'))
-                        delays.append(max(0.01, frame.info.get("duration", 70) / 1000.0))
-                    
-                    # Close original image to free memory
-                    img.close()
-                    img = None
+            self._play_frames(frames, delays, duration, loops)
                     
-                    print(f"[DEBUG] Playing animated GIF with {len(frames)} frames (duration={duration}, loops={loops})")
-                    start_time = time.time()
-                    frame_idx = 0
-                    loop_count = 0
-                    while not self.stop_event.is_set():
-                        # Check duration limit
-                        if duration > 0 and (time.time() - start_time >= duration):
-                            break
-                        # Check loop limit
-                        if loops > 0 and loop_count >= loops:
-                            break
-                            
-                        self.matrix.SetImage(frames[frame_idx])
-                        time.sleep(delays[frame_idx])
-                        frame_idx = (frame_idx + 1) % len(frames)
-                        if frame_idx == 0:
-                            loop_count += 1
-                else:
-                    # Static image - display forever or until duration
-                    print(f"[DEBUG] Displaying static image (duration={duration})")
-                    resized = ImageOps.fit(img.convert("RGB"), (64, 64), method=Image.Resampling.LANCZOS)
-                    rotated = self._rotate_image(resized)
+        except Exception as e:
+            print(f"[ERROR] Image display failed: {e}")
+            import traceback
+            traceback.print_exc()
+        finally:
+            # Clean up memory
+            if img:
+                try:
                     img.close()
-                    img = None
-                    self.matrix.SetImage(rotated.convert('RGB'))
-                    start_time = time.time()
-                    while not self.stop_event.is_set():
-                        if duration > 0 and (time.time() - start_time >= duration):
-                            break
-                        time.sleep(0.1)
-                        
-            except Exception as e:
-                print(f"[ERROR] Image display failed: {e}")
-                import traceback
-                traceback.print_exc()
-            finally:
-                # Clean up memory
-                if frames:
-                    frames.clear()
-                if img:
-                    try:
-                        img.close()
-                    except:
-                        pass
-                self.current_job = None
-                gc.collect()  # Force garbage collection
-                
-        # Stop any current job first
-        self._stop_current_job()
-        self.stop_event.clear()
-        self.current_job = "image"
-        t = threading.Thread(target=worker, daemon=True)
-        t.start()
+                except:
+                    pass
+            gc.collect()  # Force garbage collection
         
     def show_text(self, text, duration=0, scroll=False, icon=None, bg_color=(0, 0, 0), text_color=(255, 255, 255)):
         """
@@ -319,116 +486,158 @@ class MatrixHandler:
             bg_color: Background color tuple (R, G, B)
             text_color: Text color tuple (R, G, B)
         """
-        def worker():
-            try:
-                img = Image.new("RGB", (64, 64), bg_color)
-                draw = ImageDraw.Draw(img)
-                
-                # Draw optional icon
-                icon_width = 0
-                if icon:
-                    icon_width = self._draw_icon(draw, icon, 4, 22)
-                    if icon_width > 0:
-                        icon_width += 4  # padding after icon
-                
-                # Calculate text area
-                text_area_width = 64 - icon_width - 4
-                text_x_start = icon_width + 2
-                
-                # Auto-scale font size based on text length
-                # Try different font sizes until text fits
-                font_sizes = [14, 12, 10, 9, 8] if not icon else [10, 9, 8, 7]
-                
-                best_font = None
-                best_lines = []
-                best_line_height = 10
-                
-                for font_size in font_sizes:
-                    try:
-                        test_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", font_size)
-                    except:
-                        test_font = ImageFont.load_default()
-                        
-                    line_height = font_size + 2
-                    max_lines = 64 // line_height
-                    
-                    lines = self._wrap_text(text, test_font, text_area_width)
+        self._enqueue("text", self._do_text, text, duration, scroll, icon, bg_color, text_color)
+
+    def _do_text(self, text, duration, scroll, icon, bg_color, text_color):
+        try:
+            img = Image.new("RGB", (64, 64), bg_color)
+            draw = ImageDraw.Draw(img)
+            
+            # Draw optional icon
+            icon_width = 0
+            if icon:
+                icon_width = self._draw_icon(draw, icon, 4, 22)
+                if icon_width > 0:
+                    icon_width += 4  # padding after icon
+            
+            # Calculate text area
+            text_area_width = 64 - icon_width - 4
+            text_x_start = icon_width + 2
+            
+            # Auto-scale font size based on text length
+            # Try different font sizes until text fits
+            font_sizes = [14, 12, 10, 9, 8] if not icon else [10, 9, 8, 7]
+            
+            best_font = None
+            best_lines = []
+            best_line_height = 10
+            
+            for font_size in font_sizes:
+                test_font = load_font("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", font_size)
                     
-                    # Check if it fits
-                    if len(lines) <= max_lines:
-                        best_font = test_font
-                        best_lines = lines
-                        best_line_height = line_height
-                        break
-                
-                # Fallback if nothing fits - use smallest and truncate
-                if not best_font:
-                    try:
-                        best_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 7)
-                    except:
-                        best_font = ImageFont.load_default()
-                    best_line_height = 9
-                    max_lines = 64 // best_line_height
-                    best_lines = self._wrap_text(text, best_font, text_area_width)[:max_lines]
+                line_height = font_size + 2
+                max_lines = 64 // line_height
                 
-                # Calculate vertical centering
-                total_height = len(best_lines) * best_line_height
-                y_start = (64 - total_height) // 2
+                lines = self._wrap_text(text, test_font, text_area_width)
                 
-                # Draw each line centered
-                for i, line in enumerate(best_lines):
-                    bbox = draw.textbbox((0, 0), line, font=best_font)
-                    line_width = bbox[2] - bbox[0]
-                    x = text_x_start + (text_area_width - line_width) // 2
-                    y = y_start + i * best_line_height
-                    # Shadow for readability
-                    draw.text((x + 1, y + 1), line, fill=(0, 0, 0), font=best_font)
-                    draw.text((x, y), line, fill=text_color, font=best_font)
-                
-                if scroll:
-                    # Scrolling mode for long text
-                    try:
-                        scroll_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 12)
-                    except:
-                        scroll_font = ImageFont.load_default()
-                    scroll_img = Image.new("RGB", (1000, 64), bg_color)
-                    scroll_draw = ImageDraw.Draw(scroll_img)
-                    scroll_draw.text((64, 24), text, fill=text_color, font=scroll_font)
-                    text_w = scroll_draw.textlength(text, font=scroll_font)
-                    
-                    start_time = time.time()
-                    x = 0
-                    while not self.stop_event.is_set():
-                        if duration > 0 and (time.time() - start_time >= duration):
-                            break
-                        x = (x + 1) % (int(text_w) + 128)
-                        frame = scroll_img.crop((x, 0, x + 64, 64))
-                        rotated = self._rotate_image(frame)
-                        self.matrix.SetImage(rotated.convert('RGB'))
-                        time.sleep(0.03)
+                # Check if it fits
+                if len(lines) <= max_lines:
+                    best_font = test_font
+                    best_lines = lines
+                    best_line_height = line_height
+                    break
+            
+            # Fallback if nothing fits - use smallest and truncate
+            if not best_font:
+                best_font = load_font("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 7)
+                best_line_height = 9
+                max_lines = 64 // best_line_height
+                best_lines = self._wrap_text(text, best_font, text_area_width)[:max_lines]
+            
+            # Calculate vertical centering
+            total_height = len(best_lines) * best_line_height
+            y_start = (64 - total_height) // 2
+            
+            # Draw each line centered
+            for i, line in enumerate(best_lines):
+                bbox = draw.textbbox((0, 0), line, font=best_font)
+                line_width = bbox[2] - bbox[0]
+                x = text_x_start + (text_area_width - line_width) // 2
+                y = y_start + i * best_line_height
+                # Shadow for readability
+                draw.text((x + 1, y + 1), line, fill=(0, 0, 0), font=best_font)
+                draw.text((x, y), line, fill=text_color, font=best_font)
+            
+            if scroll:
+                # Scrolling mode for long text
+                scroll_img, period = self._scroll_strip(text, bg_color, text_color)
+                strip_img = self._rotate_image(scroll_img)
+                if np is not None:
+                    windows = self._scroll_windows(np.asarray(strip_img))
                 else:
-                    # Static display
-                    rotated = self._rotate_image(img)
-                    self.matrix.SetImage(rotated.convert('RGB'))
-                    start_time = time.time()
-                    while not self.stop_event.is_set():
-                        if duration > 0 and (time.time() - start_time >= duration):
-                            break
-                        time.sleep(0.1)
-                        
-            except Exception as e:
-                print(f"[ERROR] Text display failed: {e}")
-                import traceback
-                traceback.print_exc()
-            finally:
-                self.current_job = None
+                    # Without numpy, paste into one reused frame instead of crop()
+                    viewport = Image.new("RGB", (64, 64), bg_color)
                 
-        # Stop any current job first
-        self._stop_current_job()
-        self.stop_event.clear()
-        self.current_job = "text"
-        t = threading.Thread(target=worker, daemon=True)
-        t.start()
+                start_time = time.time()
+                x = 0
+                while not self.stop_event.is_set():
+                    if duration > 0 and (time.time() - start_time >= duration):
+                        break
+                    x = (x + 1) % period
+                    if np is not None:
+                        frame = windows[x]
+                    else:
+                        left, top = self._scroll_offset(strip_img.size, x)
+                        viewport.paste(strip_img, (-left, -top))
+                        frame = viewport
+                    self._push(frame)
+                    if self.stop_event.wait(0.03):
+                        break
+            else:
+                # Static display
+                rotated = self._rotate_image(img)
+                self._push(rotated.convert('RGB'))
+                self._hold(duration)
+                    
+        except Exception as e:
+            print(f"[ERROR] Text display failed: {e}")
+            import traceback
+            traceback.print_exc()
+    
+    def _scroll_strip(self, text, bg_color, text_color):
+        """
+        Cached render_scroll_strip, bounded by SCROLL_CACHE_BYTES. Only the
+        display worker calls it, so no lock. Never modify the returned strip.
+        """
+        key = (text, bg_color, text_color)
+        entry = self._scroll_cache.get(key)
+        if entry is not None:
+            self._scroll_cache.move_to_end(key)
+            return entry
+        entry = render_scroll_strip(text, bg_color, text_color)
+        nbytes = entry[0].width * entry[0].height * 4  # PIL stores RGB as 4 bytes per pixel
+        if nbytes <= self.SCROLL_CACHE_BYTES:
+            self._scroll_cache[key] = entry
+            self._scroll_cache_bytes += nbytes
+            while self._scroll_cache_bytes > self.SCROLL_CACHE_BYTES:
+                _, (evicted, _) = self._scroll_cache.popitem(last=False)
+                self._scroll_cache_bytes -= evicted.width * evicted.height * 4
+        return entry
+    
+    def _scroll_windows(self, strip):
+        """
+        View every scroll position of a strip that was already rotated with
+        _rotate_image as one (positions, 64, 64, 3) array indexed by scroll
+        offset. Building the views copies nothing, but _push still copies each
+        window into a new image (twice for rotation 0 and 180, whose windows
+        are not contiguous).
+        """
+        if self.rotation in (90, 270):
+            # Scroll runs down the rows: (n, 64, 3, 64) -> (n, 64, 64, 3)
+            windows = np.lib.stride_tricks.sliding_window_view(strip, 64, axis=0)
+            windows = np.moveaxis(windows, 3, 1)
+        else:
+            # Scroll runs along the columns: (64, n, 3, 64) -> (n, 64, 64, 3)
+            windows = np.lib.stride_tricks.sliding_window_view(strip, 64, axis=1)
+            windows = windows.transpose(1, 0, 3, 2)
+        if self.rotation in (180, 270):
+            windows = windows[::-1]  # Offset 0 sits at the far end of the strip
+        return windows
+    
+    def _scroll_offset(self, strip_size, x):
+        """
+        Return the (left, top) corner of the 64x64 window at scroll offset x
+        in a strip that was already rotated with _rotate_image (used when
+        numpy is unavailable).
+        """
+        width, height = strip_size
+        if self.rotation == 90:
+            return 0, x
+        elif self.rotation == 180:
+            return width - 64 - x, 0
+        elif self.rotation == 270:
+            return 0, height - 64 - x
+        return x, 0
     
     def _wrap_text(self, text, font, max_width):
         """Wrap text to fit within max_width"""
@@ -438,7 +647,7 @@ class MatrixHandler:
         
         for word in words:
             test_line = f"{current_line} {word}".strip()
-            bbox = ImageDraw.Draw(Image.new("RGB", (1, 1))).textbbox((0, 0), test_line, font=font)
+            bbox = font.getbbox(test_line)
             if bbox[2] - bbox[0] <= max_width:
                 current_line = test_line
             else:
@@ -474,19 +683,13 @@ class MatrixHandler:
         if icon["shape"] == "circle":
             draw.ellipse([x, y, x + size, y + size], fill=color)
             if "char" in icon:
-                try:
-                    char_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 14)
-                except:
-                    char_font = ImageFont.load_default()
+                char_font = load_font("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 14)
                 draw.text((x + 5, y + 2), icon["char"], fill=(255, 255, 255), font=char_font)
                 
         elif icon["shape"] == "triangle":
             points = [(x + size//2, y), (x, y + size), (x + size, y + size)]
             draw.polygon(points, fill=color)
-            try:
-                char_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 12)
-            except:
-                char_font = ImageFont.load_default()
+            char_font = load_font("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 12)
             draw.text((x + 6, y + 6), "!", fill=(0, 0, 0), font=char_font)
             
         elif icon["shape"] == "heart":
@@ -535,68 +738,97 @@ class MatrixHandler:
             city: City name
             duration: Seconds to display. 0 = forever until stopped
         """
-        def worker():
-            try:
-                print(f"[DEBUG] Fetching weather for: {city}")
-                weather_data = weather_service.get_weather(city)
-                print(f"[DEBUG] Weather: {weather_data['temp']}{weather_data['temp_unit']}, {weather_data['condition']}")
-                
-                # Create the weather display image
+        self._enqueue("weather", self._do_weather, city, duration)
+
+    def _do_weather(self, city, duration):
+        try:
+            print(f"[DEBUG] Fetching weather for: {city}")
+            weather_data = weather_service.get_weather(city)
+            print(f"[DEBUG] Weather: {weather_data['temp']}{weather_data['temp_unit']}, {weather_data['condition']}")
+            
+            # Render each distinct display once; repeat pings reuse the rotated frame
+            key = tuple(weather_data.get(k) for k in ("condition_name", "icon_code", "temp", "temp_unit", "city"))
+            frame = self._weather_cache.get(key)
+            if frame is None:
                 img = create_weather_display(weather_data)
-                rotated = self._rotate_image(img)
-                self.matrix.SetImage(rotated.convert('RGB'))
-                
-                start_time = time.time()
-                while not self.stop_event.is_set():
-                    if duration > 0 and (time.time() - start_time >= duration):
-                        break
-                    time.sleep(0.1)
-            except Exception as e:
-                print(f"[ERROR] Weather display failed: {e}")
-                import traceback
-                traceback.print_exc()
-            finally:
-                self.current_job = None
-                
-        # Stop any current job first
-        self._stop_current_job()
-        self.stop_event.clear()
-        self.current_job = "weather"
-        t = threading.Thread(target=worker, daemon=True)
-        t.start()
+                frame = self._rotate_image(img).convert('RGB')
+                self._weather_cache[key] = frame
+                while len(self._weather_cache) > self.WEATHER_CACHE_SIZE:
+                    self._weather_cache.popitem(last=False)
+            else:
+                self._weather_cache.move_to_end(key)
+            self._push(frame)
+            self._hold(duration)
+        except Exception as e:
+            print(f"[ERROR] Weather display failed: {e}")
+            import traceback
+            traceback.print_exc()
+        
+    def status(self):
+        """
+        Snapshot for /matrix/status. Takes no lock: current_job is read once
+        (a single reference read is atomic), so the result may be stale by at
+        most one job transition but is never internally inconsistent.
+        """
+        job = self.current_job
+        return {
+            "current_job_type": job,
+            "status": "running" if job else "idle"
+        }
         
     def clear(self):
-        self.stop_event.set()
-        self.matrix.Clear()
-        self.current_job = None
+        self._enqueue("clear", self.matrix.Clear)
         
     def stop_current(self):
-        self.stop_event.set()
-        self.current_job = None
+        with self._lock:
+            # Bumping the generation also cancels a job the worker has already
+            # dequeued but not yet started
+            self._generation += 1
+            self._drain_queue()
+            self.stop_event.set()
 
 matrix_handler = MatrixHandler()
 
 class RequestHandler(BaseHTTPRequestHandler):
+    # Keep-alive lets pollers reuse one connection instead of a TCP handshake per request
+    protocol_version = "HTTP/1.1"
+    # Close idle keep-alive connections instead of parking a thread on them
+    timeout = 5
+
+    def _send_json(self, payload, status=200, close=False):
+        """Send a JSON response with an explicit Content-Length"""
+        body = orjson.dumps(payload) if orjson else json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if close:
+            # Also sets close_connection, so the server drops the socket after this
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_empty(self, status):
+        self.send_response(status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
     def do_GET(self):
         if self.path == '/matrix/status':
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            status = {
-                "current_job_type": matrix_handler.current_job,
-                "status": "running" if matrix_handler.current_job else "idle"
-            }
-            self.wfile.write(json.dumps(status).encode())
+            self._send_json(matrix_handler.status())
         else:
-            self.send_response(404)
-            self.end_headers()
+            self._send_empty(404)
             
     def do_POST(self):
-        content_length = int(self.headers['Content-Length'])
+        content_length = int(self.headers.get('Content-Length', 0))
+        if content_length > MAX_IMAGE_BYTES:
+            # The body is left unread, so this connection can't be reused
+            self._send_json({"ok": False, "error": f"Request body exceeds {MAX_IMAGE_BYTES} bytes"},
+                            status=413, close=True)
+            return
         post_data = self.rfile.read(content_length)
         
         try:
-            data = json.loads(post_data.decode('utf-8'))
+            data = orjson.loads(post_data) if orjson else json.loads(post_data)
         except:
             data = {}
             
@@ -654,7 +886,9 @@ class RequestHandler(BaseHTTPRequestHandler):
             bg_color = tuple(data.get('bg_color', [0, 0, 0]))
             text_color = tuple(data.get('text_color', [255, 255, 255]))
             
-            if text:
+            if text and len(text) > MAX_TEXT_CHARS:
+                response = {"ok": False, "error": f"Text longer than {MAX_TEXT_CHARS} characters"}
+            elif text:
                 matrix_handler.show_text(text, duration, scroll=scroll, icon=icon, 
                                         bg_color=bg_color, text_color=text_color)
                 response = {"ok": True, "message": "Text display started"}
@@ -676,16 +910,13 @@ class RequestHandler(BaseHTTPRequestHandler):
             response = {"ok": True, "message": "Current job stopped"}
             
         else:
-            self.send_response(404)
-            self.end_headers()
+            self._send_empty(404)
             return
             
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.end_headers()
-        self.wfile.write(json.dumps(response).encode())
+        self._send_json(response)
 
 if __name__ == '__main__':
-    server = HTTPServer(('0.0.0.0', 9191), RequestHandler)
+    # One thread per connection: a slow upload or keep-alive client never blocks status/stop
+    server = ThreadingHTTPServer(('0.0.0.0', 9191), RequestHandler)
     print("Simple server running on http://0.0.0.0:9191")
     server.serve_forever()